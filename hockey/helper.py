@@ -1,12 +1,12 @@
 import asyncio
+import functools
 import logging
-import re
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 from typing import Dict, List, Optional, Pattern, Tuple, Union
 
 import discord
 import pytz
-from discord.ext.commands.converter import Converter, EmojiConverter
+from discord.ext.commands.converter import Converter
 from discord.ext.commands.errors import BadArgument
 from redbot.core.bot import Red
 from redbot.core.commands import Context
@@ -17,6 +17,17 @@ from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 from .constants import TEAMS
 from .teamentry import TeamEntry
 
+try:
+    import regex as re
+except ImportError:
+    import re
+
+try:
+    # available in Python 3.9+ and avoids pytz's localize dance
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
 _ = Translator("Hockey", __file__)
 
 log = logging.getLogger("red.trusty-cogs.Hockey")
@@ -29,12 +40,82 @@ DAY_REF_RE = re.compile(r"(yesterday|tomorrow|today)", re.I)
 YEAR_RE = re.compile(r"((19|20)\d\d)-?\/?((19|20)\d\d)?")
 # https://www.regular-expressions.info/dates.html
 
-TIMEZONE_RE = re.compile(r"|".join(re.escape(zone) for zone in pytz.common_timezones), flags=re.I)
+# both date styles in one pattern so TeamDateFinder only scans the
+# argument once; the named group distinguishes which alternative hit
+_DATE_OR_DAY_RE = re.compile(DATE_RE.pattern + r"|(?P<day_ref>" + DAY_REF_RE.pattern + r")", re.I)
+
+
+def _build_team_emojis() -> Dict[str, discord.PartialEmoji]:
+    """Parse each team's static emoji string once at import"""
+    emojis = {}
+    for team, data in TEAMS.items():
+        if not data["emoji"]:
+            continue
+        name, emoji_id = data["emoji"].split(":")
+        emojis[team] = discord.PartialEmoji(name=name, id=int(emoji_id))
+    return emojis
+
+
+_TEAM_EMOJI: Dict[str, discord.PartialEmoji] = _build_team_emojis()
+
+# lowered team names for substring checks plus exact nickname aliases
+# so check_valid_team doesn't iterate TEAMS on every call
+_TEAM_NAMES: List[Tuple[str, str]] = sorted((team.lower(), team) for team in TEAMS)
+_TEAM_ALIASES: Dict[str, List[str]] = {
+    "montreal canadiens": ["Montréal Canadiens"],
+    "habs": ["Montréal Canadiens"],
+    "montreal": ["Montréal Canadiens"],
+    "avs": ["Colorado Avalanche"],
+    "preds": ["Nashville Predators"],
+    "bolts": ["Tampa Bay Lightning"],
+    "jackets": ["Columbus Blue Jackets"],
+    "bjs": ["Columbus Blue Jackets"],
+    "isles": ["New York Islanders"],
+    "sens": ["Ottawa Senators"],
+    "pens": ["Pittsburgh Penguins"],
+    "caps": ["Washington Capitals"],
+}
+
+# longest-first so e.g. "America/North_Dakota/Center" wins over "America/North_Dakota"
+_TZ_BY_LOWER = {zone.lower(): zone for zone in pytz.common_timezones}
+_TZ_SORTED = sorted(_TZ_BY_LOWER, key=len, reverse=True)
+
+
+def _build_team_patterns() -> List[Tuple[str, Pattern]]:
+    """Compile one pattern per team at import so the converters
+    only pay for `search` calls at runtime.
+
+    Patterns stay separate per team because cities, words and even
+    tri-codes are shared between teams ("montreal", "new york", "NYA")
+    and every team matching a token must be returned.
+    """
+    patterns = []
+    for team, data in TEAMS.items():
+        if "Team" in team:
+            continue
+        nick = data["nickname"]
+        short = data["tri_code"]
+        pattern = fr"{short}\b|" + r"|".join(fr"\b{i}\b" for i in team.split())
+        if nick:
+            pattern += r"|" + r"|".join(fr"\b{i}\b" for i in nick)
+        patterns.append((team, re.compile(fr"\b{pattern}", flags=re.I)))
+    return patterns
+
+
+_TEAM_PATTERNS: List[Tuple[str, Pattern]] = _build_team_patterns()
+
+
+@functools.lru_cache(maxsize=None)
+def _tz(name: str) -> tzinfo:
+    # pytz.common_timezones is a small closed set so an unbounded
+    # cache is safe and saves the lookup on every embed timestamp
+    if ZoneInfo is not None:
+        return ZoneInfo(name)
+    return pytz.timezone(name)
 
 
 def utc_to_local(utc_dt: datetime, new_timezone: str = "US/Pacific") -> datetime:
-    eastern = pytz.timezone(new_timezone)
-    return utc_dt.replace(tzinfo=timezone.utc).astimezone(tz=eastern)
+    return utc_dt.replace(tzinfo=timezone.utc).astimezone(tz=_tz(new_timezone))
 
 
 class YearFinder(Converter):
@@ -45,6 +126,8 @@ class YearFinder(Converter):
     """
 
     async def convert(self, ctx: Context, argument: str) -> re.Match:
+        if not any(c.isdigit() for c in argument):
+            raise BadArgument(_("`{arg}` is not a valid year.").format(arg=argument))
         find = YEAR_RE.search(argument)
         if find:
             return find
@@ -60,6 +143,10 @@ class DateFinder(Converter):
     """
 
     async def convert(self, ctx: Context, argument: str) -> Optional[datetime]:
+        # cheap C-level scan saves starting the regex engine when
+        # the argument can't possibly contain a date
+        if not any(c.isdigit() for c in argument):
+            return datetime.utcnow()
         find = DATE_RE.search(argument)
         if find:
             date_str = f"{find.group(1)}-{find.group(3)}-{find.group(4)}"
@@ -74,16 +161,18 @@ class TimezoneFinder(Converter):
     """
 
     async def convert(self, ctx: Context, argument: str) -> str:
-        find = TIMEZONE_RE.search(argument)
-        if find:
-            return find.group(0)
-        else:
-            raise BadArgument(
-                _(
-                    "`{argument}` is not a valid timezone. Please see "
-                    "`{prefix}hockeyset timezone list`."
-                ).format(argument=argument, prefix=ctx.clean_prefix)
-            )
+        arg_lower = argument.lower()
+        if arg_lower in _TZ_BY_LOWER:
+            return _TZ_BY_LOWER[arg_lower]
+        for lowered in _TZ_SORTED:
+            if lowered in arg_lower:
+                return _TZ_BY_LOWER[lowered]
+        raise BadArgument(
+            _(
+                "`{argument}` is not a valid timezone. Please see "
+                "`{prefix}hockeyset timezone list`."
+            ).format(argument=argument, prefix=ctx.clean_prefix)
+        )
 
 
 class TeamDateFinder(Converter):
@@ -95,38 +184,38 @@ class TeamDateFinder(Converter):
         self, ctx: Context, argument: str
     ) -> Dict[str, Optional[Union[datetime, List[str], str]]]:
         result: Dict[str, Optional[Union[datetime, List[str], str]]] = {"team": []}
-        find = DATE_RE.search(argument)
-        day_ref = DAY_REF_RE.search(argument)
+        find = None
+        day_ref = None
+        lowered = argument.lower()
+        if any(c.isdigit() for c in argument) or (
+            "yester" in lowered or "tomor" in lowered or "today" in lowered
+        ):
+
+            def _strip(match) -> str:
+                nonlocal find, day_ref
+                if match.group("day_ref"):
+                    if day_ref is None:
+                        day_ref = match
+                elif find is None:
+                    find = match
+                return ""
+
+            argument = _DATE_OR_DAY_RE.sub(_strip, argument)
         if find:
             date_str = f"{find.group(1)}-{find.group(3)}-{find.group(4)}"
             result["date"] = datetime.strptime(date_str, "%Y-%m-%d")
-            argument = DATE_RE.sub("", argument)
         if day_ref:
             today = utc_to_local(datetime.utcnow())
-            if day_ref.group(1).lower() == "yesterday":
+            if day_ref.group("day_ref").lower() == "yesterday":
                 result["date"] = today + timedelta(days=-1)
-            elif day_ref.group(1).lower() == "tomorrow":
+            elif day_ref.group("day_ref").lower() == "tomorrow":
                 result["date"] = today + timedelta(days=+1)
             else:
                 result["date"] = today
-            argument = DAY_REF_RE.sub("", argument)
-        potential_teams = argument.split()
-        for team, data in TEAMS.items():
-            if "Team" in team:
-                continue
-            nick = data["nickname"]
-            short = data["tri_code"]
-            pattern = fr"{short}\b|" + r"|".join(fr"\b{i}\b" for i in team.split())
-            if nick:
-                pattern += r"|" + r"|".join(fr"\b{i}\b" for i in nick)
-            # log.debug(pattern)
-            reg: Pattern = re.compile(fr"\b{pattern}", flags=re.I)
-            for pot in potential_teams:
-                find = reg.findall(pot)
-                if find:
-                    log.debug(reg)
-                    log.debug(find)
-                    result["team"].append(team)
+        for team, reg in _TEAM_PATTERNS:
+            if reg.search(argument):
+                log.debug(reg)
+                result["team"].append(team)
 
         return result
 
@@ -154,12 +243,9 @@ class HockeyTeams(Converter):
             # This is just some extra stuff to correct the team picker
             msg = _("There's multiple teams with that name, pick one of these:\n")
             new_msg = None
-            if my_perms.add_reactions and my_perms.use_external_emojis:
+            team_emojis = [_TEAM_EMOJI.get(team) for team in team_list]
+            if my_perms.add_reactions and my_perms.use_external_emojis and None not in team_emojis:
                 new_msg = await ctx.send(msg)
-                team_emojis = [
-                    await EmojiConverter().convert(ctx, "<:" + TEAMS[team]["emoji"] + ">")
-                    for team in team_list
-                ]
                 log.debug(team_emojis)
                 log.debug(team_list)
                 pred = ReactionPredicate.with_emojis(team_emojis, message=new_msg)
@@ -257,23 +343,16 @@ async def get_team_role(guild: discord.Guild, home_team: str, away_team: str) ->
     This returns the role mentions if they exist
     Otherwise it returns the name of the team as a str
     """
-    home_role = None
-    away_role = None
-
-    for role in guild.roles:
-        if "Montréal Canadiens" in home_team and "Montreal Canadiens" in role.name:
-            home_role = role.mention
-        elif role.name == home_team:
-            home_role = role.mention
-        if "Montréal Canadiens" in away_team and "Montreal Canadiens" in role.name:
-            away_role = role.mention
-        elif role.name == away_team:
-            away_role = role.mention
-    if home_role is None:
-        home_role = home_team
-    if away_role is None:
-        away_role = away_team
-    return home_role, away_role
+    roles_by_name = {role.name: role for role in guild.roles}
+
+    def _mention(team: str) -> str:
+        role = roles_by_name.get(team)
+        if role is None and "Montréal Canadiens" in team:
+            # role names don't always carry the accent
+            role = roles_by_name.get("Montreal Canadiens")
+        return role.mention if role else team
+
+    return _mention(home_team), _mention(away_team)
 
 
 async def get_team(bot: Red, team: str) -> TeamEntry:
@@ -284,9 +363,9 @@ async def get_team(bot: Red, team: str) -> TeamEntry:
         team_entry = TeamEntry("Null", team, 0, [], {}, [], "")
         team_list.append(team_entry.to_json())
         await config.teams.set(team_list)
-    for teams in team_list:
-        if team == teams["team_name"]:
-            return teams
+    teams_index = {teams["team_name"]: teams for teams in team_list}
+    if team in teams_index:
+        return teams_index[team]
     # Add unknown teams to the config to track stats
     return_team = TeamEntry("Null", team, 0, [], {}, [], "")
     team_list.append(return_team.to_json())
@@ -318,28 +397,14 @@ async def check_valid_team(team_name: str, standings: bool = False) -> List[str]
         return [team_name]
     if team_name.lower() in division and standings:
         return [team_name]
-    for team in TEAMS:
-        if team_name.lower() in team.lower():
+    lowered = team_name.lower()
+    for lowered_team, team in _TEAM_NAMES:
+        if lowered in lowered_team and team not in is_team:
+            is_team.append(team)
+    for team in _TEAM_ALIASES.get(lowered, []):
+        if team not in is_team:
             is_team.append(team)
-    if team_name.lower() in ["montreal canadiens", "habs", "montreal"]:
-        is_team.append("Montréal Canadiens")
-    if team_name.lower() == "avs":
-        is_team.append("Colorado Avalanche")
-    if team_name.lower() == "preds":
-        is_team.append("Nashville Predators")
-    if team_name.lower() == "bolts":
-        is_team.append("Tampa Bay Lightning")
-    if team_name.lower() in ["jackets", "bjs"]:
-        is_team.append("Columbus Blue Jackets")
-    if team_name.lower() == "isles":
-        is_team.append("New York Islanders")
-    if team_name.lower() == "sens":
-        is_team.append("Ottawa Senators")
-    if team_name.lower() == "pens":
-        is_team.append("Pittsburgh Penguins")
-    if team_name.lower() == "caps":
-        is_team.append("Washington Capitals")
-    return list(set(is_team))
+    return is_team
 
 
 async def get_channel_obj(bot: Red, channel_id: int, data: dict) -> Optional[discord.TextChannel]:
@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import logging
+import operator
 from typing import List, Pattern, Tuple, Union, Optional, Literal
 
 import discord
@@ -16,9 +18,58 @@ _ = Translator("ReTrigger", __file__)
 
 try:
     import regex as re
+
+    # VERSION1 enables atomic groups and possessive quantifiers so
+    # user supplied patterns can avoid catastrophic backtracking;
+    # passed per-compile so other users of the shared regex module
+    # keep the default behaviour
+    _TRIGGER_FLAGS = re.VERSION1
 except ImportError:
     import re
 
+    _TRIGGER_FLAGS = 0
+
+_CHANNEL_RE = re.compile(r"<#([0-9]+)>$")
+_MEMBER_RE = re.compile(r"<@!?([0-9]+)>$")
+_ROLE_RE = re.compile(r"<@&([0-9]+)>$")
+_EMOJI_RE = re.compile(r"<a?:[A-Za-z0-9_]+:([0-9]+)>$|(:[A-Za-z0-9_]+:$)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_cached(pattern: str) -> Pattern:
+    """Dedupe compilation of identical patterns shared across triggers"""
+    return re.compile(pattern, _TRIGGER_FLAGS)
+
+
+_VALID_REACTIONS = frozenset(
+    {
+        "dm",
+        "dmme",
+        "remove_role",
+        "add_role",
+        "ban",
+        "kick",
+        "text",
+        "filter",
+        "delete",
+        "publish",
+        "react",
+        "rename",
+        "command",
+        "mock",
+    }
+)
+# response type -> (permissions attribute, human readable name)
+_REQUIRED_PERMS = {
+    "add_role": ("manage_roles", "Manage Roles"),
+    "remove_role": ("manage_roles", "Manage Roles"),
+    "filter": ("manage_messages", "Manage Messages"),
+    "publish": ("manage_messages", "Manage Messages"),
+    "ban": ("ban_members", "Ban Members"),
+    "kick": ("kick_members", "Kick Members"),
+    "react": ("add_reactions", "Add Reactions"),
+}
+
 
 class MultiResponse(Converter):
     """
@@ -27,51 +78,24 @@ class MultiResponse(Converter):
     """
 
     async def convert(self, ctx: commands.Context, argument: str) -> Union[List[str], List[int]]:
-        result = []
-        match = re.split(r"(;)", argument)
-        valid_reactions = [
-            "dm",
-            "dmme",
-            "remove_role",
-            "add_role",
-            "ban",
-            "kick",
-            "text",
-            "filter",
-            "delete",
-            "publish",
-            "react",
-            "rename",
-            "command",
-            "mock",
-        ]
-        log.debug(match)
+        result = argument.split(";")
+        log.debug(result)
         my_perms = ctx.channel.permissions_for(ctx.me)
-        if match[0] not in valid_reactions:
+        if result[0] not in _VALID_REACTIONS:
             raise BadArgument(
-                _("`{response}` is not a valid reaction type.").format(response=match[0])
+                _("`{response}` is not a valid reaction type.").format(response=result[0])
             )
-        for m in match:
-            if m == ";":
-                continue
-            else:
-                result.append(m)
         if result[0] == "filter":
             result[0] = "delete"
         if len(result) < 2 and result[0] not in ["delete", "ban", "kick"]:
             raise BadArgument(_("The provided multi response pattern is not valid."))
-        if result[0] in ["add_role", "remove_role"] and not my_perms.manage_roles:
-            raise BadArgument(_('I require "Manage Roles" permission to use that.'))
-        if result[0] == "filter" and not my_perms.manage_messages:
-            raise BadArgument(_('I require "Manage Messages" permission to use that.'))
-        if result[0] == "publish" and not my_perms.manage_messages:
-            raise BadArgument(_('I require "Manage Messages" permission to use that.'))
-        if result[0] == "ban" and not my_perms.ban_members:
-            raise BadArgument(_('I require "Ban Members" permission to use that.'))
-        if result[0] == "kick" and not my_perms.kick_members:
-            raise BadArgument(_('I require "Kick Members" permission to use that.'))
-        if result[0] == "react" and not my_perms.add_reactions:
-            raise BadArgument(_('I require "Add Reactions" permission to use that.'))
+        required_perm = _REQUIRED_PERMS.get(result[0])
+        if required_perm and not getattr(my_perms, required_perm[0]):
+            raise BadArgument(
+                _('I require "{permission}" permission to use that.').format(
+                    permission=required_perm[1]
+                )
+            )
         if result[0] == "mock":
             msg = await ctx.send(
                 _(
@@ -125,6 +149,36 @@ class Trigger:
     Trigger class to handle trigger objects
     """
 
+    __slots__ = (
+        "name",
+        "regex",
+        "search",
+        "findall",
+        "response_type",
+        "author",
+        "enabled",
+        "count",
+        "image",
+        "text",
+        "whitelist",
+        "blacklist",
+        "cooldown",
+        "multi_payload",
+        "created_at",
+        "ignore_commands",
+        "check_edits",
+        "ocr_search",
+        "delete_after",
+        "read_filenames",
+        "chance",
+        "reply",
+        "tts",
+        "user_mention",
+        "role_mention",
+        "everyone_mention",
+        "nsfw",
+    )
+
     name: str
     regex: Pattern
     response_type: List[
@@ -169,9 +223,14 @@ class Trigger:
     def __init__(self, name, regex, response_type, author, **kwargs):
         self.name = name
         try:
-            self.regex = re.compile(regex)
+            # ValidRegex hands us an already compiled pattern while
+            # saved triggers come back from config as plain strings
+            self.regex = regex if hasattr(regex, "pattern") else _compile_cached(regex)
         except Exception:
             raise
+        # pre-bound so the per-message hot path skips two attribute lookups
+        self.search = self.regex.search
+        self.findall = self.regex.findall
         self.response_type = response_type
         self.author = author
         self.enabled = kwargs.get("enabled", True)
@@ -244,34 +303,38 @@ class Trigger:
         )
         return info
 
-    async def to_json(self) -> dict:
-        return {
-            "name": self.name,
-            "regex": self.regex.pattern,
-            "response_type": self.response_type,
-            "author": self.author,
-            "enabled": self.enabled,
-            "count": self.count,
-            "image": self.image,
-            "text": self.text,
-            "whitelist": self.whitelist,
-            "blacklist": self.blacklist,
-            "cooldown": self.cooldown,
-            "multi_payload": self.multi_payload,
-            "created_at": self.created_at,
-            "ignore_commands": self.ignore_commands,
-            "check_edits": self.check_edits,
-            "ocr_search": self.ocr_search,
-            "delete_after": self.delete_after,
-            "read_filenames": self.read_filenames,
-            "chance": self.chance,
-            "reply": self.reply,
-            "tts": self.tts,
-            "user_mention": self.user_mention,
-            "everyone_mention": self.everyone_mention,
-            "role_mention": self.role_mention,
-            "nsfw": self.nsfw,
-        }
+    _JSON_ATTRS = (
+        "name",
+        "response_type",
+        "author",
+        "enabled",
+        "count",
+        "image",
+        "text",
+        "whitelist",
+        "blacklist",
+        "cooldown",
+        "multi_payload",
+        "created_at",
+        "ignore_commands",
+        "check_edits",
+        "ocr_search",
+        "delete_after",
+        "read_filenames",
+        "chance",
+        "reply",
+        "tts",
+        "user_mention",
+        "everyone_mention",
+        "role_mention",
+        "nsfw",
+    )
+    _JSON_GETTER = operator.attrgetter(*_JSON_ATTRS)
+
+    def to_json(self) -> dict:
+        data = dict(zip(self._JSON_ATTRS, self._JSON_GETTER(self)))
+        data["regex"] = self.regex.pattern
+        return data
 
     @classmethod
     async def from_json(cls, data: dict):
@@ -317,10 +380,9 @@ class ValidRegex(Converter):
     https://github.com/Cog-Creators/Red-DiscordBot/blob/V3/develop/redbot/cogs/mod/mod.py#L24
     """
 
-    async def convert(self, ctx: commands.Context, argument: str) -> str:
+    async def convert(self, ctx: commands.Context, argument: str) -> Pattern:
         try:
-            re.compile(argument)
-            result = argument
+            result = _compile_cached(argument)
         except Exception as e:
             log.error("Retrigger conversion error")
             err_msg = _("`{arg}` is not a valid regex pattern. {e}").format(arg=argument, e=e)
@@ -343,9 +405,7 @@ class ValidEmoji(IDConverter):
     """
 
     async def convert(self, ctx: commands.Context, argument: str) -> Union[discord.Emoji, str]:
-        match = self._get_id_match(argument) or re.match(
-            r"<a?:[a-zA-Z0-9\_]+:([0-9]+)>$|(:[a-zA-z0-9\_]+:$)", argument
-        )
+        match = self._get_id_match(argument) or _EMOJI_RE.match(argument)
         result = None
         bot = ctx.bot
         guild = ctx.guild
@@ -357,14 +417,9 @@ class ValidEmoji(IDConverter):
             if result is None:
                 result = discord.utils.get(bot.emojis, name=argument)
         elif match.group(1):
-            emoji_id = int(match.group(1))
-
-            # Try to look up emoji by id.
-            if guild:
-                result = discord.utils.get(guild.emojis, id=emoji_id)
-
-            if result is None:
-                result = discord.utils.get(bot.emojis, id=emoji_id)
+            # emoji IDs are globally unique so the state cache lookup
+            # covers the local guild as well
+            result = bot.get_emoji(int(match.group(1)))
         else:
             emoji_name = str(match.group(2)).replace(":", "")
 
@@ -399,36 +454,28 @@ class ChannelUserRole(IDConverter):
         self, ctx: commands.Context, argument: str
     ) -> Union[discord.TextChannel, discord.Member, discord.Role]:
         guild = ctx.guild
-        result = None
         id_match = self._get_id_match(argument)
-        channel_match = re.match(r"<#([0-9]+)>$", argument)
-        member_match = re.match(r"<@!?([0-9]+)>$", argument)
-        role_match = re.match(r"<@&([0-9]+)>$", argument)
-        for converter in ["channel", "role", "member"]:
-            if converter == "channel":
-                match = id_match or channel_match
-                if match:
-                    channel_id = match.group(1)
-                    result = guild.get_channel(int(channel_id))
-                else:
-                    result = discord.utils.get(guild.text_channels, name=argument)
-            if converter == "member":
-                match = id_match or member_match
-                if match:
-                    member_id = match.group(1)
-                    result = guild.get_member(int(member_id))
-                else:
-                    result = guild.get_member_named(argument)
-            if converter == "role":
-                match = id_match or role_match
-                if match:
-                    role_id = match.group(1)
-                    result = guild.get_role(int(role_id))
-                else:
-                    result = discord.utils.get(guild._roles.values(), name=argument)
-            if result:
-                break
-        if not result:
-            msg = _("{arg} is not a valid channel, user or role.").format(arg=argument)
-            raise BadArgument(msg)
-        return result
+
+        match = id_match or _CHANNEL_RE.match(argument)
+        if match:
+            result = guild.get_channel(int(match.group(1)))
+        else:
+            result = discord.utils.get(guild.text_channels, name=argument)
+        if result:
+            return result
+        match = id_match or _ROLE_RE.match(argument)
+        if match:
+            result = guild.get_role(int(match.group(1)))
+        else:
+            result = discord.utils.get(guild._roles.values(), name=argument)
+        if result:
+            return result
+        match = id_match or _MEMBER_RE.match(argument)
+        if match:
+            result = guild.get_member(int(match.group(1)))
+        else:
+            result = guild.get_member_named(argument)
+        if result:
+            return result
+        msg = _("{arg} is not a valid channel, user or role.").format(arg=argument)
+        raise BadArgument(msg)
@@ -97,7 +97,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             async with self.config.guild(guild).trigger_list() as trigger_list:
                 for trigger in triggers:
                     try:
-                        trigger_list[trigger.name] = await trigger.to_json()
+                        trigger_list[trigger.name] = trigger.to_json()
                     except KeyError:
                         continue
                     await asyncio.sleep(0.1)
@@ -408,7 +408,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             msg = _("Cooldown for Trigger `{name}` reset.")
         trigger_list = await self.config.guild(ctx.guild).trigger_list()
         trigger.cooldown = cooldown
-        trigger_list[trigger.name] = await trigger.to_json()
+        trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         await self.config.guild(ctx.guild).trigger_list.set(trigger_list)
@@ -440,7 +440,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             if obj.id not in trigger.whitelist:
                 async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
                     trigger.whitelist.append(obj.id)
-                    trigger_list[trigger.name] = await trigger.to_json()
+                    trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} added `{list_type}` to its allowlist.")
@@ -476,7 +476,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             if obj.id in trigger.whitelist:
                 async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
                     trigger.whitelist.remove(obj.id)
-                    trigger_list[trigger.name] = await trigger.to_json()
+                    trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} removed `{list_type}` from its allowlist.")
@@ -509,7 +509,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             if obj.id not in trigger.blacklist:
                 async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
                     trigger.blacklist.append(obj.id)
-                    trigger_list[trigger.name] = await trigger.to_json()
+                    trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} added `{list_type}` to its blocklist.")
@@ -545,7 +545,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             if obj.id in trigger.blacklist:
                 async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
                     trigger.blacklist.remove(obj.id)
-                    trigger_list[trigger.name] = await trigger.to_json()
+                    trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} removed `{list_type}` from its blocklist.")
@@ -571,13 +571,15 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("Trigger `{name}` doesn't exist.").format(name=trigger))
         if not await self.can_edit(ctx.author, trigger):
             return await ctx.send(_("You are not authorized to edit this trigger."))
-        trigger.regex = re.compile(regex)
+        trigger.regex = regex
+        trigger.search = regex.search
+        trigger.findall = regex.findall
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} regex changed to ```bf\n{regex}\n```")
-        await ctx.send(msg.format(name=trigger.name, regex=regex))
+        await ctx.send(msg.format(name=trigger.name, regex=regex.pattern))
 
     @_edit.command(name="ocr")
     @commands.check(lambda ctx: TriggerHandler.ALLOW_OCR)
@@ -597,7 +599,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.ocr_search = not trigger.ocr_search
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} OCR Search set to: {ocr_search}")
@@ -621,7 +623,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.nsfw = not trigger.nsfw
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} NSFW set to: {nsfw}")
@@ -648,7 +650,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.read_filenames = not trigger.read_filenames
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} read filenames set to: {read_filenames}")
@@ -678,7 +680,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.reply = set_to
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} replies set to: {set_to}")
@@ -704,7 +706,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.tts = set_to
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} text-to-speech set to: {set_to}")
@@ -732,7 +734,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.user_mention = set_to
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} user mentions set to: {set_to}")
@@ -760,7 +762,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.everyone_mention = set_to
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} everyone mentions set to: {set_to}")
@@ -788,7 +790,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.role_mention = set_to
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} role mentions set to: {set_to}")
@@ -813,7 +815,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.check_edits = not trigger.check_edits
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} check edits set to: {ignore_edits}")
@@ -842,7 +844,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("That trigger cannot be edited this way."))
         trigger.text = text
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} text changed to `{text}`")
@@ -873,7 +875,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You cannot have a negative chance of triggers happening."))
         trigger.chance = chance
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         if chance:
@@ -917,7 +919,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             delete_after_seconds = None
         trigger.delete_after = delete_after_seconds
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} will now delete after `{time}` seconds.")
@@ -941,7 +943,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("You are not authorized to edit this trigger."))
         trigger.ignore_commands = not trigger.ignore_commands
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} ignoring commands set to `{text}`")
@@ -979,7 +981,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("That trigger cannot be edited this way."))
         trigger.text = command
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} command changed to `{command}`")
@@ -1020,7 +1022,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("That trigger cannot be edited this way."))
         trigger.text = role_ids
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} role edits changed to `{roles}`")
@@ -1049,7 +1051,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("That trigger cannot be edited this way."))
         trigger.text = emojis
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} reactions changed to {emojis}")
@@ -1072,7 +1074,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("Trigger `{name}` doesn't exist.").format(name=trigger))
         trigger.enabled = True
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         self.triggers[ctx.guild.id].append(trigger)
         msg = _("Trigger {name} has been enabled.")
@@ -1094,7 +1096,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             return await ctx.send(_("Trigger `{name}` doesn't exist.").format(name=trigger))
         trigger.enabled = False
         async with self.config.guild(ctx.guild).trigger_list() as trigger_list:
-            trigger_list[trigger.name] = await trigger.to_json()
+            trigger_list[trigger.name] = trigger.to_json()
         await self.remove_trigger_from_cache(ctx.guild.id, trigger)
         msg = _("Trigger {name} has been disabled.")
         await ctx.send(msg.format(name=trigger.name))
@@ -1322,7 +1324,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1355,7 +1357,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1385,7 +1387,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1415,7 +1417,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1448,7 +1450,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1498,7 +1500,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1532,7 +1534,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1586,7 +1588,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1638,7 +1640,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1670,7 +1672,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1702,7 +1704,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1735,7 +1737,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1763,7 +1765,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1800,7 +1802,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1853,7 +1855,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1896,7 +1898,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1939,7 +1941,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -1982,7 +1984,7 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
 
@@ -2049,6 +2051,6 @@ class ReTrigger(TriggerHandler, commands.Cog):
             self.triggers[ctx.guild.id] = []
         self.triggers[ctx.guild.id].append(new_trigger)
         trigger_list = await self.config.guild(guild).trigger_list()
-        trigger_list[name] = await new_trigger.to_json()
+        trigger_list[name] = new_trigger.to_json()
         await self.config.guild(guild).trigger_list.set(trigger_list)
         await ctx.send(_("Trigger `{name}` set.").format(name=name))
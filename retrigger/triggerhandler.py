@@ -517,9 +517,9 @@ class TriggerHandler:
         """
         if await self.config.guild(guild).bypass():
             # log.debug(f"Bypassing safe regex in guild {guild.name} ({guild.id})")
-            return (True, trigger.regex.findall(content))
+            return (True, trigger.findall(content))
         try:
-            process = self.re_pool.apply_async(trigger.regex.findall, (content,))
+            process = self.re_pool.apply_async(trigger.findall, (content,))
             task = functools.partial(process.get, timeout=self.trigger_timeout)
             new_task = self.bot.loop.run_in_executor(None, task)
             search = await asyncio.wait_for(new_task, timeout=self.trigger_timeout + 5)
@@ -1011,7 +1011,7 @@ class TriggerHandler:
                     content = (
                         message.content + " " + " ".join(f.filename for f in message.attachments)
                     )
-                search = trigger.regex.search(content)
+                search = trigger.search(content)
                 if not search:
                     continue
                 try: